@@ -0,0 +1,11 @@
+"""Bit depths of the generated wav files, grouped by target medium."""
+
+from typing import Final
+
+import numpy as np
+
+AUDIO_BIT_DEPTH: Final[dict[str, np.ndarray]] = {
+    "cd_audio": np.asarray((16,), dtype=np.uint8),
+    "dvd_audio": np.asarray((24,), dtype=np.uint8),
+    "studio": np.asarray((32,), dtype=np.uint8),
+}
@@ -0,0 +1,40 @@
+"""Frequency tables for the generated test tones.
+
+All values are expressed in hertz and rounded to two decimal places,
+which is the precision the generate-wavs executable accepts.
+"""
+
+from typing import Final
+
+import numpy as np
+
+_TUNING_STANDARD_A4: Final[tuple[float, ...]] = (
+    415.30,  # baroque pitch
+    432.00,
+    435.00,  # diapason normal
+    440.00,  # concert pitch (ISO 16)
+    442.00,
+    444.00,
+)
+
+# Twelve equal-temperament ratios 2**(n/12), computed once at import and
+# shared by every table derived from the reference pitches below.
+_SEMITONE_RATIOS: Final[np.ndarray] = np.power(
+    2.0, np.arange(12, dtype=np.float64) / 12.0
+)
+
+# Ratios applied to every A4 reference above in a single vectorized outer
+# product instead of a per-element nested loop; rounding happens in place
+# so the build allocates exactly one array.
+_base = np.asarray(_TUNING_STANDARD_A4, dtype=np.float64)
+_semitone_table = np.multiply.outer(_base, _SEMITONE_RATIOS)
+np.round(_semitone_table, 2, out=_semitone_table)
+_TUNING_SEMITONES: Final[np.ndarray] = _semitone_table.ravel()
+
+# Tables are kept as contiguous fixed-dtype arrays rather than tuples of
+# boxed floats; float64 is retained because the values must round-trip
+# exactly through the executable's text interface.
+AUDIO_FREQUENCY: Final[dict[str, np.ndarray]] = {
+    "tuning_a4": _base,
+    "semitones": _TUNING_SEMITONES,
+}
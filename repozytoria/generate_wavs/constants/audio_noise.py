@@ -0,0 +1,17 @@
+"""Noise types and volumes mixed into the generated test tones."""
+
+from typing import Final
+
+import numpy as np
+
+AUDIO_NOISE_TYPE: Final[dict[str, tuple[str, ...]]] = {
+    "none": ("none",),
+    "white": ("white",),
+    "pink": ("pink",),
+    "brown": ("brown",),
+}
+
+AUDIO_NOISE_VOLUME: Final[dict[str, np.ndarray]] = {
+    "quiet": np.asarray((0.05, 0.1), dtype=np.float64),
+    "loud": np.asarray((0.25, 0.5), dtype=np.float64),
+}
@@ -0,0 +1,11 @@
+"""Sample rates of the generated wav files, grouped by target medium."""
+
+from typing import Final
+
+import numpy as np
+
+AUDIO_SAMPLE_RATE: Final[dict[str, np.ndarray]] = {
+    "cd_audio": np.asarray((44100, 88200), dtype=np.int32),
+    "dvd_audio": np.asarray((48000, 96000), dtype=np.int32),
+    "blu-ray": np.asarray((176400, 192000), dtype=np.int32),
+}
@@ -0,0 +1,71 @@
+"""Scenario definitions mapping parameter names to the values to sweep."""
+
+from types import MappingProxyType
+from typing import Final
+
+SCENARIO_NAMES: Final[frozenset[str]] = frozenset(("Normal", "Stress"))
+
+
+def _build_scenarios() -> dict[str, dict]:
+    """Build the scenario table; runs once, on first SCENARIOS access."""
+    import numpy as np
+
+    from constants.audio_bit_depth import AUDIO_BIT_DEPTH
+    from constants.audio_frequencies import AUDIO_FREQUENCY
+    from constants.audio_noise import AUDIO_NOISE_TYPE, AUDIO_NOISE_VOLUME
+    from constants.sample_rates import AUDIO_SAMPLE_RATE
+
+    # Value groups shared between scenarios, concatenated once and
+    # referenced by name so no scenario holds its own copy.
+    sr_cd_dvd = np.concatenate(
+        (AUDIO_SAMPLE_RATE["cd_audio"], AUDIO_SAMPLE_RATE["dvd_audio"])
+    )
+    sr_cd_dvd_br = np.concatenate((sr_cd_dvd, AUDIO_SAMPLE_RATE["blu-ray"]))
+    bd_cd_dvd = np.concatenate(
+        (AUDIO_BIT_DEPTH["cd_audio"], AUDIO_BIT_DEPTH["dvd_audio"])
+    )
+    bd_cd_dvd_studio = np.concatenate((bd_cd_dvd, AUDIO_BIT_DEPTH["studio"]))
+    noise_none_pink = AUDIO_NOISE_TYPE["none"] + AUDIO_NOISE_TYPE["pink"]
+    noise_white_pink = AUDIO_NOISE_TYPE["white"] + AUDIO_NOISE_TYPE["pink"]
+    nv_quiet_loud = np.concatenate(
+        (AUDIO_NOISE_VOLUME["quiet"], AUDIO_NOISE_VOLUME["loud"])
+    )
+
+    return {
+        "Normal": {
+            "sample_rate": sr_cd_dvd,
+            "bit_depth": bd_cd_dvd,
+            "duration": (5,),
+            "frequency": AUDIO_FREQUENCY["tuning_a4"],
+            "phase_shift": (0.0,),
+            "noise_type": noise_none_pink,
+            "noise_volume": AUDIO_NOISE_VOLUME["quiet"],
+        },
+        "Stress": {
+            "sample_rate": sr_cd_dvd_br,
+            "bit_depth": bd_cd_dvd_studio,
+            "duration": (5,),
+            "frequency": AUDIO_FREQUENCY["semitones"],
+            "phase_shift": (0.0, 0.5),
+            "noise_type": noise_white_pink,
+            "noise_volume": nv_quiet_loud,
+        },
+    }
+
+
+def __getattr__(name: str):
+    # PEP 562: realize the table on first access, so importing this
+    # module just for SCENARIO_NAMES never builds the value arrays.
+    if name == "SCENARIOS":
+        table = _build_scenarios()
+        if frozenset(table) != SCENARIO_NAMES:
+            # The names are listed separately above so that reading them
+            # stays cheap; catch any drift the moment the table is built.
+            raise RuntimeError(
+                f"SCENARIO_NAMES {sorted(SCENARIO_NAMES)} is out of sync "
+                f"with the scenario table {sorted(table)}"
+            )
+        scenarios = MappingProxyType(table)
+        globals()["SCENARIOS"] = scenarios
+        return scenarios
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
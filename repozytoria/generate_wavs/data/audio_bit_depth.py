@@ -0,0 +1,5 @@
+"""Legacy import path; the canonical table lives in constants."""
+
+from constants.audio_bit_depth import AUDIO_BIT_DEPTH
+
+__all__ = ["AUDIO_BIT_DEPTH"]
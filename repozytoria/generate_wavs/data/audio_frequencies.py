@@ -0,0 +1,5 @@
+"""Legacy import path; the canonical table lives in constants."""
+
+from constants.audio_frequencies import AUDIO_FREQUENCY
+
+__all__ = ["AUDIO_FREQUENCY"]
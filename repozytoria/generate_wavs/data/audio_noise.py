@@ -0,0 +1,5 @@
+"""Legacy import path; the canonical tables live in constants."""
+
+from constants.audio_noise import AUDIO_NOISE_TYPE, AUDIO_NOISE_VOLUME
+
+__all__ = ["AUDIO_NOISE_TYPE", "AUDIO_NOISE_VOLUME"]
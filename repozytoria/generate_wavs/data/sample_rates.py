@@ -0,0 +1,5 @@
+"""Legacy import path; the canonical table lives in constants."""
+
+from constants.sample_rates import AUDIO_SAMPLE_RATE
+
+__all__ = ["AUDIO_SAMPLE_RATE"]
@@ -0,0 +1,5 @@
+"""Legacy import path; the canonical scenario mapping lives in constants."""
+
+from constants.sound_scenario import SCENARIO_NAMES, SCENARIOS
+
+__all__ = ["SCENARIO_NAMES", "SCENARIOS"]
@@ -0,0 +1,358 @@
+"""Drive the generate-wavs Rust executable over a scenario's parameter grid."""
+
+import argparse
+import importlib
+import json
+import math
+import multiprocessing
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain, cycle, product
+
+import numpy as np
+
+from constants.sound_scenario import SCENARIO_NAMES
+
+
+# Combinations buffered ahead of the workers, per worker. Bounds peak
+# memory at O(workers) while keeping every worker fed.
+_QUEUE_DEPTH_FACTOR = 2
+
+
+def _output_name(keys: tuple, combination: tuple) -> str:
+    """Deterministic wav filename for one combination, keys sorted."""
+    return (
+        "_".join(f"{key}-{value}" for key, value in sorted(zip(keys, combination)))
+        + ".wav"
+    )
+
+
+def _iter_combinations(
+    keys: tuple,
+    combinations: Iterable[tuple],
+    filter_fn: Callable[[dict], bool] | None,
+    skip_fn: Callable[[tuple], bool] | None = None,
+) -> Iterator[tuple]:
+    """Yield the combinations that pass filter_fn and skip_fn.
+
+    Eliding a combination saves one process spawn. Uniqueness needs no
+    bookkeeping here: each value list is deduplicated before the product
+    is formed, so the input can never repeat a tuple, and tracking seen
+    tuples would hold the whole product in memory.
+    """
+    for combination in combinations:
+        if filter_fn is not None and not filter_fn(dict(zip(keys, combination))):
+            continue
+        if skip_fn is not None and skip_fn(combination):
+            continue
+        yield combination
+
+
+def _run_args(args: list) -> None:
+    """Run one fully-formed argv, raising CalledProcessError on failure.
+
+    communicate() drains stderr while the child runs, so a chatty
+    executable can never fill the pipe buffer and deadlock the sweep.
+    close_fds=False (with no preexec_fn or cwd) keeps CPython on its
+    posix_spawn fast path instead of fork+exec, avoiding the copy of the
+    parent's page tables on every spawn.
+    """
+    proc = subprocess.Popen(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        close_fds=False,
+    )
+    _, stderr = proc.communicate()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, args, stderr=stderr)
+
+
+def run_rust_program(
+    executable_path: str,
+    flag_names: tuple[str, ...],
+    str_values: tuple[str, ...],
+) -> None:
+    """Run the Rust executable once over parallel flag/value sequences.
+
+    Taking the already-formatted sequences directly avoids building a
+    dict per combination just to unpack and re-iterate it here.
+    """
+    _run_args([executable_path, *chain.from_iterable(zip(flag_names, str_values))])
+
+
+def _report_progress(counter, total: int, start: float) -> None:
+    """Print one 'M of N' line with elapsed time and ETA to stderr."""
+    with counter.get_lock():
+        counter.value += 1
+        done = counter.value
+    elapsed = time.monotonic() - start
+    eta = elapsed / done * (total - done)
+    print(
+        f"{done} of {total} elapsed={elapsed:.1f}s eta={eta:.0f}s",
+        file=sys.stderr,
+    )
+
+
+def _queue_worker(
+    executable_path: str,
+    flag_names: tuple[str, ...],
+    queue: multiprocessing.JoinableQueue,
+    failures,
+    core: int | None = None,
+    progress: tuple | None = None,
+) -> None:
+    """Consume combination tuples from the queue until the None sentinel.
+
+    Flag names and value strings are both prepared by the dispatcher, so
+    each combination is just interleaved into an argv and run. When a
+    core is given the worker pins itself to it; spawned executables
+    inherit the affinity, which stops the scheduler migrating them
+    across caches mid-sweep and keeps batch timings reproducible.
+    """
+    if core is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {core})
+    while True:
+        combination = queue.get()
+        if combination is None:
+            queue.task_done()
+            break
+        try:
+            run_rust_program(executable_path, flag_names, combination)
+        except (subprocess.CalledProcessError, OSError) as error:
+            # OSError covers spawn failures (missing or non-executable
+            # path); letting it escape would kill the worker mid-queue
+            # and leave queue.join() waiting forever.
+            with failures.get_lock():
+                failures.value += 1
+            print(f"combination failed: {error}", file=sys.stderr)
+        finally:
+            if progress is not None:
+                _report_progress(*progress)
+            queue.task_done()
+
+
+def _combination_grid(keys: tuple, values: tuple) -> np.ndarray:
+    """Materialize the Cartesian product of values as an (N, K) object array.
+
+    One np.meshgrid broadcast replaces N Python-level zip/dict
+    constructions; row order matches itertools.product over the same
+    values.
+    """
+    arrays = [np.asarray(v, dtype=object) for v in values]
+    return np.stack(np.meshgrid(*arrays, indexing="ij"), axis=-1).reshape(
+        -1, len(keys)
+    )
+
+
+def run_rust_batch(executable_path: str, combinations: list) -> None:
+    """Run the whole sweep as one executable invocation.
+
+    The combinations are written to a temporary JSON file whose path is
+    passed via --batch; the executable deserializes it and loops
+    internally, amortizing startup, allocator and buffer setup across
+    every combination with no per-combination syscall traffic.
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".json", delete=False
+    ) as handle:
+        json.dump(combinations, handle)
+    try:
+        _run_args([executable_path, "--batch", handle.name])
+    finally:
+        os.unlink(handle.name)
+
+
+def execute_scenario(
+    executable_path: str,
+    settings: dict,
+    batch: bool = False,
+    jobs: int | None = None,
+    dry_run: bool = False,
+    output_dir: str | None = None,
+    skip_existing: bool = False,
+) -> None:
+    """Run the executable for every combination of the scenario's settings.
+
+    With batch=True all combinations are streamed to a single persistent
+    worker process; otherwise they are fanned out across one worker per
+    CPU so independent Rust processes generate their wav files in
+    parallel. The parallel path feeds workers through a bounded queue,
+    keeping peak memory proportional to the worker count no matter how
+    large the Cartesian product grows.
+    """
+    # An optional "filter" entry is a predicate over the combination
+    # dict, not a swept parameter.
+    filter_fn = settings.get("filter")
+    sweep = {key: value for key, value in settings.items() if key != "filter"}
+    keys, values = zip(*sweep.items())
+    # Constant tables are typed ndarrays; unbox them to plain Python
+    # scalars once here, at the boundary where values become argv text.
+    values = tuple(
+        value.tolist() if isinstance(value, np.ndarray) else value for value in values
+    )
+    # Drop duplicates inside each value list (order-preserving) so the
+    # product is duplicate-free and its size can be reported exactly.
+    values = tuple(list(dict.fromkeys(value)) for value in values)
+    skip_fn = None
+    if skip_existing and output_dir is not None:
+        # Resume support: a combination whose deterministic output file
+        # already exists is not rerun, so a crashed sweep restarts from
+        # where it stopped instead of from scratch.
+        def skip_fn(combination: tuple) -> bool:
+            return os.path.exists(
+                os.path.join(output_dir, _output_name(keys, combination))
+            )
+    if dry_run:
+        # Print the planned command lines without spawning anything, so a
+        # sweep can be validated at enumeration cost only.
+        flag_names = tuple(f"--{key}" for key in keys)
+        for combination in _iter_combinations(
+            keys, product(*values), filter_fn, skip_fn
+        ):
+            print(
+                shlex.join(
+                    [
+                        executable_path,
+                        *chain.from_iterable(zip(flag_names, map(str, combination))),
+                    ]
+                )
+            )
+        return
+    # Fail fast on a bad executable path before anything is spawned;
+    # this is the first error a user typically hits and it should not
+    # surface once per combination (or, worse, hang the worker pool).
+    if not (os.path.isfile(executable_path) and os.access(executable_path, os.X_OK)):
+        raise FileNotFoundError(f"not an executable: {executable_path}")
+    if batch:
+        rows = map(tuple, _combination_grid(keys, values).tolist())
+        combinations = [
+            dict(zip(keys, row))
+            for row in _iter_combinations(keys, rows, filter_fn, skip_fn)
+        ]
+        run_rust_batch(executable_path, combinations)
+        return
+    # Clamp to at least one worker: zero workers would also mean zero
+    # sentinels, deadlocking queue.join() below.
+    workers = max(1, jobs or os.cpu_count() or 1)
+    flag_names = tuple(f"--{key}" for key in keys)
+    queue = multiprocessing.JoinableQueue(maxsize=_QUEUE_DEPTH_FACTOR * workers)
+    core_cycle = cycle(range(os.cpu_count() or 1))
+    total = math.prod(len(value) for value in values)
+    if filter_fn is not None or skip_fn is not None:
+        # Filtered or skipped combinations never reach the queue, so the
+        # plain product size would overstate N and the ETA. A counting
+        # pass over the filtered product is trivial next to one spawn.
+        total = sum(
+            1 for _ in _iter_combinations(keys, product(*values), filter_fn, skip_fn)
+        )
+    progress = (multiprocessing.Value("i", 0), total, time.monotonic())
+    failures = multiprocessing.Value("i", 0)
+    processes = [
+        multiprocessing.Process(
+            target=_queue_worker,
+            args=(
+                executable_path,
+                flag_names,
+                queue,
+                failures,
+                next(core_cycle),
+                progress,
+            ),
+            daemon=True,
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    if filter_fn is None:
+        # Each value is stringified once per list entry here rather than
+        # once per combination in the workers; a value appearing in
+        # N/len(list) combinations is converted a single time.
+        str_values = tuple(tuple(map(str, value_list)) for value_list in values)
+        combinations = _iter_combinations(keys, product(*str_values), None, skip_fn)
+    else:
+        # Predicates compare against the raw values, so stringify after
+        # filtering in this (rare) case.
+        combinations = (
+            tuple(map(str, combination))
+            for combination in _iter_combinations(
+                keys, product(*values), filter_fn, skip_fn
+            )
+        )
+    for combination in combinations:
+        queue.put(combination)
+    for _ in processes:
+        queue.put(None)
+    queue.join()
+    for process in processes:
+        process.join()
+    if failures.value:
+        raise RuntimeError(f"{failures.value} of {total} combinations failed")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate wav files for a sound scenario."
+    )
+    parser.add_argument(
+        "scenario", choices=SCENARIO_NAMES, help="Name of the scenario to run."
+    )
+    parser.add_argument(
+        "executable_path", help="Path to the generate-wavs executable."
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Stream all combinations to one persistent worker process.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of parallel worker processes (default: CPU count).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the planned command lines without running anything.",
+    )
+    parser.add_argument(
+        "--source",
+        default="constants",
+        choices=("constants", "data"),
+        help="Package to load the scenario table from.",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="Directory where the executable writes its wav files.",
+    )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Skip combinations whose wav already exists in --output-dir.",
+    )
+    args = parser.parse_args()
+    # Deferred so the scenario tables are only built once arguments have
+    # validated; SCENARIO_NAMES above is a cheap literal.
+    scenarios = importlib.import_module(f"{args.source}.sound_scenario").SCENARIOS
+    execute_scenario(
+        args.executable_path,
+        scenarios[args.scenario],
+        batch=args.batch,
+        jobs=args.jobs,
+        dry_run=args.dry_run,
+        output_dir=args.output_dir,
+        skip_existing=args.skip_existing,
+    )
+
+
+if __name__ == "__main__":
+    main()